@@ -1,8 +1,8 @@
-import json
 import os
 import threading
 import time
 from typing import Dict, Any, Optional
+import orjson
 import portalocker  # We'll use this for cross-platform file locking
 
 MAX_KEY_LENGTH = 32
@@ -54,7 +54,7 @@ class KeyValueStore:
         if len(key) > MAX_KEY_LENGTH:
             raise KeyTooLongError(f"Key must be {MAX_KEY_LENGTH} characters or less")
         
-        serialized_value = json.dumps(value)
+        serialized_value = orjson.dumps(value)
         if len(serialized_value) > MAX_VALUE_SIZE:
             raise ValueTooLargeError(f"Value must be {MAX_VALUE_SIZE} bytes or less when serialized")
         
@@ -115,14 +115,14 @@ class KeyValueStore:
     def load_data(self) -> None:
         with self.file_lock:
             if os.path.exists(self.file_path):
-                with portalocker.Lock(self.file_path, 'r', timeout=10) as f:
-                    self.data = json.load(f)
+                with portalocker.Lock(self.file_path, 'rb', timeout=10) as f:
+                    self.data = orjson.loads(f.read())
 
     def save_data(self) -> None:
         with self.file_lock:
             temp_file = f"{self.file_path}.tmp"
-            with portalocker.Lock(temp_file, 'w', timeout=10) as f:
-                json.dump(self.data, f)
+            with portalocker.Lock(temp_file, 'wb', timeout=10) as f:
+                f.write(orjson.dumps(self.data))
             os.replace(temp_file, self.file_path)
 
     def _ttl_cleanup(self) -> None:
@@ -144,7 +144,7 @@ class KeyValueStore:
     def _would_exceed_file_size_limit(self, new_key: str, new_entry: Dict[str, Any]) -> bool:
         # Estimate the size of the new data
         current_size = os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
-        new_data_size = len(json.dumps({new_key: new_entry}))
+        new_data_size = len(orjson.dumps({new_key: new_entry}))
         return current_size + new_data_size > MAX_FILE_SIZE
 
     def __enter__(self):